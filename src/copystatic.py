@@ -1,27 +1,39 @@
 import os
 import shutil
-from typing import NoReturn
+import sys
 
 
-def copy_files_recursive(source_dir_path: str, dest_dir_path: str) -> NoReturn:
+def copy_files_recursive(source_dir_path: str, dest_dir_path: str, verbose: bool = False) -> None:
     """
     Recursively copies the contents of a source directory to a destination directory.
 
     If the destination directory does not exist, it is created. All files and subdirectories
-    from the source are copied into the destination. Each copied path is logged to stdout.
+    from the source are copied into the destination. Subdirectories are walked with an
+    explicit stack rather than recursive calls.
 
     Args:
         source_dir_path (str): The path to the source directory to copy from.
         dest_dir_path (str): The path to the destination directory to copy to.
+        verbose (bool): If True, log each copied path to stdout in a single write at the end.
     """
-    if not os.path.exists(dest_dir_path):
-        os.mkdir(dest_dir_path)
+    pending = [(source_dir_path, dest_dir_path)]
+    log_lines = []
 
-    for filename in os.listdir(source_dir_path):
-        from_path = os.path.join(source_dir_path, filename)
-        dest_path = os.path.join(dest_dir_path, filename)
-        print(f" * {from_path} -> {dest_path}")
-        if os.path.isfile(from_path):
-            shutil.copy(from_path, dest_path)
-        else:
-            copy_files_recursive(from_path, dest_path)
+    while pending:
+        from_dir, to_dir = pending.pop()
+        os.makedirs(to_dir, exist_ok=True)
+
+        # scandir entries answer is_file() from the directory listing, avoiding a stat per entry
+        with os.scandir(from_dir) as entries:
+            for entry in entries:
+                from_path = entry.path
+                dest_path = os.path.join(to_dir, entry.name)
+                if verbose:
+                    log_lines.append(f" * {from_path} -> {dest_path}\n")
+                if entry.is_file():
+                    shutil.copyfile(from_path, dest_path)
+                else:
+                    pending.append((from_path, dest_path))
+
+    if log_lines:
+        sys.stdout.write("".join(log_lines))
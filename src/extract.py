@@ -1,6 +1,18 @@
-def extract_title(markdown):
-    for line in markdown.split("\n"):
-        stripped_line = line.strip()
+def extract_title(markdown: str) -> str:
+    """
+    Extracts the title from the first h1 heading ("# ") of a markdown document.
+
+    Args:
+        markdown (str): The full markdown string.
+
+    Returns:
+        str: The heading text, with surrounding whitespace removed.
+
+    Raises:
+        ValueError: If the document contains no h1 heading.
+    """
+    for line in markdown.splitlines():
+        stripped_line = line.lstrip()
         if stripped_line.startswith("# "):
-            return stripped_line[2:]
-        raise Exception("No title heading found in markdown")
+            return stripped_line[2:].rstrip()
+    raise ValueError("No title heading found in markdown")
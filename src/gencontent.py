@@ -1,5 +1,6 @@
 import os
 from pathlib import Path
+from extract import extract_title
 from markdown_blocks import markdown_to_html_node
 
 
@@ -39,11 +40,3 @@ def generate_page(from_path, template_path, dest_path, basepath):
         os.makedirs(dest_dir_path, exist_ok=True)
     to_file = open(dest_path, "w")
     to_file.write(template)
-
-
-def extract_title(md):
-    lines = md.split("\n")
-    for line in lines:
-        if line.startswith("# "):
-            return line[2:]
-    raise ValueError("no title found")
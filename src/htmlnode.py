@@ -11,10 +11,7 @@ class HTMLNode():
     def props_to_html(self):
         if not self.props:
             return ""
-        props_str = ""
-        for key, value in self.props.items():
-            props_str += f' {key}="{value}"'
-        return props_str
+        return "".join(f' {key}="{value}"' for key, value in self.props.items())
 
     def __repr__(self):
         return f"HTMLNode({self.tag}, {self.value}, children: {self.children}, {self.props})"
@@ -45,11 +42,7 @@ class ParentNode(HTMLNode):
         super().__init__(tag, None, children, props)
 
     def to_html(self):
-        html_content = ""
-
-        for child_node in self.children:
-            html_content += child_node.to_html()
-
+        html_content = "".join(child_node.to_html() for child_node in self.children)
         return f"<{self.tag}{self.props_to_html()}>{html_content}</{self.tag}>"
 
     def __repr__(self):
@@ -2,6 +2,20 @@ import re
 from textnode import TextNode, TextType
 from typing import List, Tuple
 
+# Inline delimiters handled by split_nodes_all_delimiters, mapped to the type they apply
+_DELIMITERS = {
+    "**": TextType.BOLD,
+    "_": TextType.ITALIC,
+    "`": TextType.CODE,
+}
+# Every position where one of the inline delimiters occurs
+_DELIMITER_RE = re.compile(r"\*\*|_|`")
+
+# Markdown image syntax: ![alt text](image_url)
+_IMAGE_RE = re.compile(r"!\[([^\[\]]*)\]\(([^\(\)]*)\)")
+# Markdown link syntax: [text](url), excluding image links (![text](url))
+_LINK_RE = re.compile(r"(?<!!)\[([^\[\]]*)\]\(([^\(\)]*)\)")
+
 
 def split_nodes_delimiter(old_nodes: List[TextNode], delimiter: str, text_type: TextType) -> List[TextNode]:
     """
@@ -43,6 +57,11 @@ def split_nodes_delimiter(old_nodes: List[TextNode], delimiter: str, text_type:
             new_nodes.append(node)
             continue
 
+        # Text without the delimiter needs no splitting: reuse the node as-is
+        if delimiter not in node.text:
+            new_nodes.append(node)
+            continue
+
         # Split the text at each delimiter occurrence
         sections = node.text.split(delimiter)
 
@@ -50,19 +69,103 @@ def split_nodes_delimiter(old_nodes: List[TextNode], delimiter: str, text_type:
         if len(sections) % 2 == 0:
             raise ValueError("Invalid markdown: Unmatched delimiter found")
 
-        # Iterate through the split sections
-        for index, section in enumerate(sections):
-            if section:
-                if index % 2 == 0:
-                    # Even index: plain (unformatted) text
-                    new_nodes.append(TextNode(section, TextType.TEXT))
-                else:
-                    # Odd index: text within delimiters, apply specified text type
-                    new_nodes.append(TextNode(section, text_type))
+        # Even index: plain (unformatted) text
+        # Odd index: text within delimiters, apply specified text type
+        new_nodes.extend([
+            TextNode(section, text_type if index % 2 else TextType.TEXT)
+            for index, section in enumerate(sections)
+            if section
+        ])
 
     return new_nodes
 
 
+def split_nodes_all_delimiters(old_nodes: List[TextNode]) -> List[TextNode]:
+    """
+    Splits text nodes on every inline delimiter (bold, italic and code) in a single pass.
+
+    For any input accepted by chaining split_nodes_delimiter for "**", "_" and "`", this
+    produces the same nodes, but each text node is scanned once instead of three times,
+    and only the positions where a delimiter occurs are visited.
+    The text between a pair of delimiters is taken literally, so formatting cannot be nested.
+
+    Args:
+        old_nodes (List[TextNode]): List of text nodes to process.
+
+    Returns:
+        List[TextNode]: A new list of text nodes with all delimited sections split out and typed.
+
+    Raises:
+        ValueError: If an opening delimiter has no matching closing delimiter.
+
+    Example:
+        >>> node = TextNode("**bold**, _italic_ and `code`", TextType.TEXT)
+        >>> split_nodes_all_delimiters([node])
+        [
+            TextNode("bold", TextType.BOLD),
+            TextNode(", ", TextType.TEXT),
+            TextNode("italic", TextType.ITALIC),
+            TextNode(" and ", TextType.TEXT),
+            TextNode("code", TextType.CODE)
+        ]
+    """
+    new_nodes = []
+
+    for node in old_nodes:
+        # Preserve non-plain-text nodes without changes
+        if node.text_type != TextType.TEXT:
+            new_nodes.append(node)
+            continue
+
+        text = node.text
+        cursor = 0
+        opener = None
+
+        # Visit only the delimiter positions, found in one pass by the compiled pattern
+        for match in _DELIMITER_RE.finditer(text):
+            delimiter = match.group()
+
+            if opener is None:
+                # Opening delimiter: emit the plain text before it
+                opener = delimiter
+                start = match.start()
+                if start > cursor:
+                    new_nodes.append(TextNode(text[cursor:start], TextType.TEXT))
+                cursor = match.end()
+            elif delimiter == opener:
+                # Matching closing delimiter: emit the delimited section
+                end = match.start()
+                if end > cursor:
+                    new_nodes.append(TextNode(text[cursor:end], _DELIMITERS[opener]))
+                cursor = match.end()
+                opener = None
+            # Any other delimiter inside an open section is literal text
+
+        if opener is not None:
+            raise ValueError("Invalid markdown: Unmatched delimiter found")
+
+        # No delimiter was found (the cursor never moved): reuse the node as-is
+        if cursor == 0:
+            new_nodes.append(node)
+            continue
+
+        # Add any text remaining after the last delimited section
+        if cursor < len(text):
+            new_nodes.append(TextNode(text[cursor:], TextType.TEXT))
+
+    return new_nodes
+
+
+def _image_spans(text: str) -> List[Tuple[str, str, int, int]]:
+    """Returns the (alt_text, image_url, start, end) span of every image in the text."""
+    return [(match.group(1), match.group(2), match.start(), match.end()) for match in _IMAGE_RE.finditer(text)]
+
+
+def _link_spans(text: str) -> List[Tuple[str, str, int, int]]:
+    """Returns the (anchor_text, link_url, start, end) span of every link in the text."""
+    return [(match.group(1), match.group(2), match.start(), match.end()) for match in _LINK_RE.finditer(text)]
+
+
 def extract_markdown_images(text: str) -> List[Tuple[str, str]]:
     """
     Extracts all image references from a Markdown-formatted string.
@@ -78,11 +181,7 @@ def extract_markdown_images(text: str) -> List[Tuple[str, str]]:
         >>> extract_markdown_images(text)
         [('rick roll', 'https://i.imgur.com/aKaOqIh.gif')]
     """
-    # Regex pattern to match Markdown image syntax: ![alt text](image_url)
-    pattern = r"!\[([^\[\]]*)\]\(([^\(\)]*)\)"
-
-    matches = re.findall(pattern, text)
-    return matches
+    return _IMAGE_RE.findall(text)
 
 
 def extract_markdown_links(text: str) -> List[Tuple[str, str]]:
@@ -102,24 +201,22 @@ def extract_markdown_links(text: str) -> List[Tuple[str, str]]:
         >>> extract_markdown_links(text)
         [('Boot.dev', 'https://www.boot.dev')]
     """
-    # Regex pattern to match markdown links [text](url), excluding image links (![text](url))
-    pattern = r"(?<!!)\[([^\[\]]*)\]\(([^\(\)]*)\)"
-
-    matches = re.findall(pattern, text)
-    return matches
+    return _LINK_RE.findall(text)
 
 
-def split_nodes_by_markdown_pattern(old_nodes: List[TextNode], pattern_type: str, extractor_func, node_type: TextType):
+def split_nodes_by_markdown_pattern(old_nodes: List[TextNode], spans_func, node_type: TextType, marker: str = "["):
     """
     Splits text nodes by a given markdown pattern (e.g., links or images),
     extracting matched patterns into separate nodes.
 
     Args:
         old_nodes (list): List of TextNode objects to process.
-        pattern_type (str): A label for the pattern type, used in error messages.
-        extractor_func (callable): A function that extracts (text, url) tuples from a string.
+        spans_func (callable): A function that returns (text, url, start, end) spans
+                               for every match in a string, in order of appearance.
         node_type (TextType): The type to assign to extracted markdown patterns
                               (e.g., TextType.LINK or TextType.IMAGE).
+        marker (str): A substring every match must contain; nodes without it are
+                      passed through without being scanned.
 
     Returns:
         list: A new list of TextNode objects, where matched patterns are separated
@@ -133,42 +230,34 @@ def split_nodes_by_markdown_pattern(old_nodes: List[TextNode], pattern_type: str
             new_nodes.append(old_node)
             continue
 
-        original_text = old_node.text
-        patterns = extractor_func(original_text)
+        text = old_node.text
 
-        # If no patterns are found, keep the node unchanged
-        if not patterns:
+        # Skip the scan when the text cannot contain a match
+        if marker not in text:
             new_nodes.append(old_node)
             continue
 
-        # Iterate through all matched patterns in the text
-        for content_text, url in patterns:
-            # Determine the full markdown syntax to split on
-            prefix = "!" if node_type == TextType.IMAGE else ""
-            pattern_markdown = f"{prefix}[{content_text}]({url})"
-            sections = original_text.split(pattern_markdown, 1)
+        spans = spans_func(text)
 
-            # Ensure the markdown syntax is correctly formed
-            if len(sections) != 2:
-                raise ValueError(
-                    f"Invalid markdown: incomplete or malformed {
-                        pattern_type} pattern: {pattern_markdown}"
-                )
+        # If no patterns are found, keep the node unchanged
+        if not spans:
+            new_nodes.append(old_node)
+            continue
 
+        # Slice the text around each match, walking the spans in order
+        cursor = 0
+        for content_text, url, start, end in spans:
             # Add text before the matched pattern (if any)
-            before_text = sections[0]
-            if before_text:
-                new_nodes.append(TextNode(before_text, TextType.TEXT))
+            if start > cursor:
+                new_nodes.append(TextNode(text[cursor:start], TextType.TEXT))
 
             # Add the matched pattern as a separate node
             new_nodes.append(TextNode(content_text, node_type, url))
-
-            # Continue processing the remaining text
-            original_text = sections[1]
+            cursor = end
 
         # Add any text remaining after the last pattern
-        if original_text:
-            new_nodes.append(TextNode(original_text, TextType.TEXT))
+        if cursor < len(text):
+            new_nodes.append(TextNode(text[cursor:], TextType.TEXT))
 
     return new_nodes
 
@@ -185,9 +274,9 @@ def split_nodes_image(old_nodes: List[TextNode]):
     """
     return split_nodes_by_markdown_pattern(
         old_nodes,
-        "Image",
-        extract_markdown_images,
-        TextType.IMAGE
+        _image_spans,
+        TextType.IMAGE,
+        "![",
     )
 
 
@@ -203,9 +292,9 @@ def split_nodes_link(old_nodes: List[TextNode]):
     """
     return split_nodes_by_markdown_pattern(
         old_nodes,
-        "Link",
-        extract_markdown_links,
-        TextType.LINK
+        _link_spans,
+        TextType.LINK,
+        "](",
     )
 
 
@@ -225,9 +314,7 @@ def text_to_textnodes(text: str) -> List[TextNode]:
     """
 
     nodes = [TextNode(text, TextType.TEXT)]
-    nodes = split_nodes_delimiter(nodes, "**", TextType.BOLD)
-    nodes = split_nodes_delimiter(nodes, "_", TextType.ITALIC)
-    nodes = split_nodes_delimiter(nodes, "`", TextType.CODE)
+    nodes = split_nodes_all_delimiters(nodes)
     nodes = split_nodes_image(nodes)
     nodes = split_nodes_link(nodes)
     return nodes
@@ -1,5 +1,6 @@
+import re
 from enum import Enum
-from typing import List
+from typing import List, Optional, Tuple
 from htmlnode import ParentNode
 from inline_markdown import text_to_textnodes
 from textnode import text_node_to_html_node, TextNode, TextType
@@ -14,6 +15,13 @@ class BlockType(Enum):
     ULIST = "unordered_list"
 
 
+# Markdown prefixes for heading levels 1 through 6
+_HEADING_PREFIXES = ("# ", "## ", "### ", "#### ", "##### ", "###### ")
+
+# One or more blank (or whitespace-only) lines separating two blocks
+_BLOCK_SEPARATOR_RE = re.compile(r"\n\s*\n")
+
+
 def markdown_to_blocks(markdown: str) -> List[str]:
     """
     Splits a Markdown document into block-level elements.
@@ -28,17 +36,8 @@ def markdown_to_blocks(markdown: str) -> List[str]:
     Returns:
         List[str]: A list of cleaned, non-empty block strings.
     """
-    # 1. Split the markdown text by double newlines.
-    blocks = markdown.split("\n\n")
-
-    # 2. Use a list comprehension to:
-    #    a. Iterate through each potential block.
-    #    b. Strip leading/trailing whitespace from the block.
-    #    c. Keep the block *only if* it's not empty after stripping.
-
-    cleaned_blocks = [block.strip() for block in blocks if block.strip()]
-
-    return cleaned_blocks
+    # Split on runs of blank lines, then strip each block and drop the empty ones
+    return [block for block in (section.strip() for section in _BLOCK_SEPARATOR_RE.split(markdown)) if block]
 
 
 def block_to_block_type(block: str) -> BlockType:
@@ -51,35 +50,64 @@ def block_to_block_type(block: str) -> BlockType:
     Returns:
         BlockType: The identified type of the markdown block.
     """
+    return _classify_block(block)[0]
 
-    lines = block.split("\n")
+
+def _classify_block(block: str) -> Tuple[BlockType, Optional[int]]:
+    """
+    Determines the BlockType of a markdown block along with any metadata found on the way.
+
+    Only the checks that can match the block's first character are run. The metadata is
+    the heading level for headings and None for every other type, so the heading handler
+    does not need to count the '#' characters again.
+
+    Args:
+        block (str): A markdown block with leading/trailing whitespace stripped.
+
+    Returns:
+        Tuple[BlockType, Optional[int]]: The block type and its metadata.
+    """
+    if not block:
+        return BlockType.PARAGRAPH, None
+
+    first_char = block[0]
 
     # # Heading: starts with 1-6 '#' characters followed by a space
-    if block.startswith(("# ", "## ", "### ", "#### ", "##### ", "###### ")):
-        return BlockType.HEADING
+    if first_char == "#":
+        if block.startswith(_HEADING_PREFIXES):
+            # The level is the number of '#' characters before the first space
+            return BlockType.HEADING, block.index(" ")
+        return BlockType.PARAGRAPH, None
+
+    lines = block.split("\n")
 
     # Code block: starts and ends with a line containing triple backticks
-    if len(lines) >= 2 and lines[0].startswith("```") and lines[-1].startswith("```"):
-        return BlockType.CODE
+    if first_char == "`":
+        if len(lines) >= 2 and lines[0].startswith("```") and lines[-1].startswith("```"):
+            return BlockType.CODE, None
 
     # Quote block: every line must start with '>'
-    if all(line.startswith(">") for line in lines):
-        return BlockType.QUOTE
+    elif first_char == ">":
+        if all(line.startswith(">") for line in lines):
+            return BlockType.QUOTE, None
 
     # Unordered list block: every line must start with '- ' (dash and space)
-    if all(line.startswith("- ") for line in lines):
-        return BlockType.ULIST
+    elif first_char == "-":
+        if all(line.startswith("- ") for line in lines):
+            return BlockType.ULIST, None
 
     # Ordered list block: lines must be in the form '1. ', '2. ', ..., in order
-    if lines[0].startswith("1. "):
-        for expected_number, line in enumerate(lines, start=1):
-            if not line.startswith(f"{expected_number}. "):
-                break
-        else:
-            return BlockType.OLIST
+    elif first_char == "1":
+        if lines[0].startswith("1. "):
+            for expected_number, line in enumerate(lines, start=1):
+                number = str(expected_number)
+                if not (line.startswith(number) and line.startswith(". ", len(number))):
+                    break
+            else:
+                return BlockType.OLIST, None
 
     # Default case: paragraph
-    return BlockType.PARAGRAPH
+    return BlockType.PARAGRAPH, None
 
 
 def text_to_children(text: str) -> List[ParentNode]:
@@ -92,9 +120,7 @@ def text_to_children(text: str) -> List[ParentNode]:
     Returns:
         List[ParentNode]: A list of HTMLNode children.
     """
-    text_nodes = text_to_textnodes(text)
-    children = [text_node_to_html_node(node) for node in text_nodes]
-    return children
+    return [text_node_to_html_node(node) for node in text_to_textnodes(text)]
 
 
 def paragraph_to_html_node(block: str) -> ParentNode:
@@ -107,28 +133,22 @@ def paragraph_to_html_node(block: str) -> ParentNode:
     Returns:
         ParentNode: HTML paragraph node with child elements.
     """
-    lines = block.split("\n")
-    paragraph = " ".join(lines)
+    paragraph = block.replace("\n", " ")
     children = text_to_children(paragraph)
     return ParentNode("p", children)
 
 
-def heading_to_html_node(block: str) -> ParentNode:
+def heading_to_html_node(block: str, level: int) -> ParentNode:
     """
     Converts a heading block into the appropriate <h1> - <h6> HTMLNode.
 
     Args:
         block (str): Markdown heading block.
+        level (int): The heading level found while classifying the block.
 
     Returns:
         ParentNode: A heading HTMLNode.
     """
-    level = 0
-    for char in block:
-        if char == "#":
-            level += 1
-        else:
-            break
     if level + 1 >= len(block):
         raise ValueError(f"invalid heading level: {level}")
     text = block[level + 1:]
@@ -168,7 +188,10 @@ def olist_to_html_node(block: str) -> ParentNode:
     items = block.split("\n")
     html_items = []
     for item in items:
-        text = item[3:]
+        # Drop the "N. " marker, which is wider than three characters from item 10 on
+        _, marker, text = item.partition(". ")
+        if not marker:
+            raise ValueError("invalid ordered list block")
         children = text_to_children(text)
         html_items.append(ParentNode("li", children))
     return ParentNode("ol", html_items)
@@ -187,7 +210,7 @@ def ulist_to_html_node(block: str) -> ParentNode:
     items = block.split("\n")
     html_items = []
     for item in items:
-        text = item[2:]
+        text = item.removeprefix("- ")
         children = text_to_children(text)
         html_items.append(ParentNode("li", children))
     return ParentNode("ul", html_items)
@@ -227,12 +250,14 @@ def block_to_html_node(block: str) -> ParentNode:
     Raises:
         ValueError: If the block type is invalid or unsupported.
     """
-    block_type = block_to_block_type(block)
+    block_type, meta = _classify_block(block)
+    # Headings are the only blocks that need the level found during classification
+    if block_type == BlockType.HEADING:
+        return heading_to_html_node(block, meta)
 
     # Use a dictionary to map block types to their respective handler functions
     block_handlers = {
         BlockType.PARAGRAPH: paragraph_to_html_node,
-        BlockType.HEADING: heading_to_html_node,
         BlockType.CODE: code_to_html_node,
         BlockType.OLIST: olist_to_html_node,
         BlockType.ULIST: ulist_to_html_node,
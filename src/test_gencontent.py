@@ -34,6 +34,16 @@ of text
         )
         self.assertEqual(actual, "title")
 
+    def test_eq_after_other_lines(self):
+        actual = extract_title(
+            """
+Some intro text
+
+   # Indented title  
+"""
+        )
+        self.assertEqual(actual, "Indented title")
+
     def test_none(self):
         try:
             extract_title(
@@ -1,6 +1,62 @@
 import unittest
+from types import MappingProxyType
 from htmlnode import HTMLNode, LeafNode, ParentNode
 
+# Shared, read-only props used across tests (read-only so no test can leak changes into another)
+CONTAINER_PROPS = MappingProxyType({"class": "container"})
+LINK_PROPS = MappingProxyType({"href": "https://example.com", "target": "_blank"})
+
+# Expected HTML for the nested and deep-nesting tests
+EXPECTED_NESTED_HTML = "<div><section><p>Paragraph inside section</p></section><h1>Heading</h1></div>"
+EXPECTED_DEEP_HTML = (
+    "<div><section><article><h1>Nested Heading</h1><p>Nested Paragraph</p></article></section></div>"
+)
+
+# (name, builder, expected) rows for the ParentNode "build tree -> to_html()" tests
+TO_HTML_CASES = (
+    (
+        "basic",
+        lambda: ParentNode("div", [LeafNode("span", "Hello")]),
+        "<div><span>Hello</span></div>",
+    ),
+    (
+        "multiple_children",
+        lambda: ParentNode("ul", [LeafNode("li", f"Item {i}") for i in (1, 2, 3)]),
+        "<ul>" + "".join(f"<li>Item {i}</li>" for i in (1, 2, 3)) + "</ul>",
+    ),
+    (
+        "with_attributes",
+        lambda: ParentNode("a", [LeafNode(None, "Click me")], {"href": "https://example.com"}),
+        '<a href="https://example.com">Click me</a>',
+    ),
+    (
+        "mixed_children_types",
+        lambda: ParentNode(
+            "div",
+            [
+                LeafNode("b", "Bold"),
+                LeafNode(None, "Normal"),
+                ParentNode("p", [LeafNode(None, "Inside paragraph")]),
+            ]
+        ),
+        "<div><b>Bold</b>Normal<p>Inside paragraph</p></div>",
+    ),
+    (
+        "special_characters",
+        lambda: ParentNode("p", [LeafNode(None, "Text with <, >, and & symbols")]),
+        "<p>Text with <, >, and & symbols</p>",
+    ),
+)
+
+# (name, factory, exception, message) rows for the error-raising tests; a message of None
+# means only the exception type is checked
+RAISES_CASES = (
+    ("htmlnode_to_html", lambda: HTMLNode(tag="div", value="Test").to_html(), NotImplementedError, None),
+    ("leafnode_without_value", lambda: LeafNode("p", None), ValueError, None),
+    ("parentnode_without_tag", lambda: ParentNode(None, [LeafNode("p", "Content")]), ValueError, "invalid HTML: no tag"),
+    ("parentnode_without_children", lambda: ParentNode("div", None), ValueError, "invalid HTML: no children"),
+)
+
 
 class TestHTMLNode(unittest.TestCase):
     def test_htmlnode_initialization(self):
@@ -10,12 +66,12 @@ class TestHTMLNode(unittest.TestCase):
             tag="div",
             value="Hello World",
             children=None,
-            props={"class": "container"}
+            props=CONTAINER_PROPS
         )
         self.assertEqual(node1.tag, "div")
         self.assertEqual(node1.value, "Hello World")
         self.assertIsNone(node1.children)
-        self.assertEqual(node1.props, {"class": "container"})
+        self.assertEqual(node1.props, CONTAINER_PROPS)
 
         # Minimal initialization
         node2 = HTMLNode()
@@ -36,10 +92,8 @@ class TestHTMLNode(unittest.TestCase):
             "id": "main",
             "data-test": "value"
         })
-        props_html = node2.props_to_html()
-        self.assertIn(' class="container"', props_html)
-        self.assertIn(' id="main"', props_html)
-        self.assertIn(' data-test="value"', props_html)
+        # Dicts keep insertion order, so the rendered attribute order is fixed
+        self.assertEqual(node2.props_to_html(), ' class="container" id="main" data-test="value"')
 
         # No properties
         node3 = HTMLNode()
@@ -56,12 +110,6 @@ class TestHTMLNode(unittest.TestCase):
         expected_repr = "HTMLNode(p, Test, children: None, {'class': 'paragraph'})"
         self.assertEqual(repr(node), expected_repr)
 
-    def test_to_html_not_implemented(self):
-        """Verify to_html method raises NotImplementedError"""
-        node = HTMLNode(tag="div", value="Test")
-        with self.assertRaises(NotImplementedError):
-            node.to_html()
-
 
 class TestLeafNode(unittest.TestCase):
     def test_leafnode_initialization(self):
@@ -74,20 +122,10 @@ class TestLeafNode(unittest.TestCase):
         self.assertIsNone(node1.props)
 
         # With properties
-        node2 = LeafNode(
-            "a",
-            "Click here",
-            {"href": "https://example.com", "target": "_blank"}
-        )
+        node2 = LeafNode("a", "Click here", LINK_PROPS)
         self.assertEqual(node2.tag, "a")
         self.assertEqual(node2.value, "Click here")
-        self.assertEqual(
-            node2.props, {"href": "https://example.com", "target": "_blank"})
-
-    def test_leafnode_value_required(self):
-        """Verify that LeafNode requires a value"""
-        with self.assertRaises(ValueError):
-            LeafNode("p", None)
+        self.assertEqual(node2.props, LINK_PROPS)
 
     def test_leafnode_to_html(self):
         """Test HTML generation for different scenarios"""
@@ -134,10 +172,11 @@ class TestLeafNode(unittest.TestCase):
 
 
 class TestParentNode(unittest.TestCase):
-    def test_basic_parent_node(self):
-        """Test a ParentNode with a single LeafNode child"""
-        node = ParentNode("div", [LeafNode("span", "Hello")])
-        self.assertEqual(node.to_html(), "<div><span>Hello</span></div>")
+    def test_to_html_cases(self):
+        """Test to_html() output for each row of TO_HTML_CASES"""
+        for name, build, expected in TO_HTML_CASES:
+            with self.subTest(name):
+                self.assertEqual(build().to_html(), expected)
 
     def test_nested_parent_nodes(self):
         """Test ParentNode containing another ParentNode with children"""
@@ -151,97 +190,37 @@ class TestParentNode(unittest.TestCase):
                 LeafNode("h1", "Heading")
             ]
         )
-        self.assertEqual(
-            node.to_html(),
-            "<div><section><p>Paragraph inside section</p></section><h1>Heading</h1></div>"
-        )
-
-    def test_multiple_children(self):
-        """Test ParentNode with multiple LeafNode children"""
-        node = ParentNode(
-            "ul",
-            [
-                LeafNode("li", "Item 1"),
-                LeafNode("li", "Item 2"),
-                LeafNode("li", "Item 3"),
-            ]
-        )
-        self.assertEqual(
-            node.to_html(), "<ul><li>Item 1</li><li>Item 2</li><li>Item 3</li></ul>")
-
-    def test_no_tag_raises_error(self):
-        """Test that ParentNode without a tag raises ValueError"""
-        with self.assertRaises(ValueError) as context:
-            ParentNode(None, [LeafNode("p", "Content")])
-        self.assertEqual(str(context.exception), "invalid HTML: no tag")
-
-    def test_no_children_raises_error(self):
-        """Test that ParentNode without children raises ValueError"""
-        with self.assertRaises(ValueError) as context:
-            ParentNode("div", None)
-        self.assertEqual(str(context.exception),
-                         "invalid HTML: no children")
+        self.assertEqual(node.to_html(), EXPECTED_NESTED_HTML)
 
     def test_empty_children_list(self):
         """Test ParentNode with an empty list of children"""
         node = ParentNode("div", [])
         self.assertEqual(node.to_html(), "<div></div>")
 
-    def test_with_attributes(self):
-        """Test ParentNode with HTML attributes (props)"""
-        node = ParentNode("a", [LeafNode(None, "Click me")], {
-                          "href": "https://example.com"})
-        self.assertEqual(
-            node.to_html(), '<a href="https://example.com">Click me</a>')
-
-    def test_mixed_children_types(self):
-        """Test ParentNode containing both LeafNode and nested ParentNode children"""
-        node = ParentNode(
-            "div",
-            [
-                LeafNode("b", "Bold"),
-                LeafNode(None, "Normal"),
-                ParentNode(
-                    "p",
-                    [LeafNode(None, "Inside paragraph")]
-                ),
-            ]
-        )
-        self.assertEqual(
-            node.to_html(),
-            "<div><b>Bold</b>Normal<p>Inside paragraph</p></div>"
-        )
-
-    def test_special_characters(self):
-        """Test handling of special characters like <, >, and & in text"""
-        node = ParentNode(
-            "p", [LeafNode(None, "Text with <, >, and & symbols")])
-        self.assertEqual(
-            node.to_html(), "<p>Text with <, >, and & symbols</p>")
-
     def test_deeply_nested_structure(self):
         """Test deeply nested ParentNodes to ensure recursion works properly"""
         node = ParentNode(
-            "div",
+            "article",
             [
-                ParentNode(
-                    "section",
-                    [
-                        ParentNode(
-                            "article",
-                            [
-                                LeafNode("h1", "Nested Heading"),
-                                LeafNode("p", "Nested Paragraph")
-                            ]
-                        )
-                    ]
-                )
+                LeafNode("h1", "Nested Heading"),
+                LeafNode("p", "Nested Paragraph")
             ]
         )
-        self.assertEqual(
-            node.to_html(),
-            "<div><section><article><h1>Nested Heading</h1><p>Nested Paragraph</p></article></section></div>"
-        )
+        # Build the tree bottom-up by wrapping the innermost node
+        for tag in ("section", "div"):
+            node = ParentNode(tag, [node])
+        self.assertEqual(node.to_html(), EXPECTED_DEEP_HTML)
+
+
+class TestNodeErrors(unittest.TestCase):
+    def test_raises_cases(self):
+        """Test that each row of RAISES_CASES raises the expected exception"""
+        for name, factory, exc, msg in RAISES_CASES:
+            with self.subTest(name):
+                with self.assertRaises(exc) as context:
+                    factory()
+                if msg is not None:
+                    self.assertEqual(str(context.exception), msg)
 
 
 if __name__ == "__main__":
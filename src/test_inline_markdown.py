@@ -1,6 +1,7 @@
 import unittest
 from inline_markdown import (
     split_nodes_delimiter,
+    split_nodes_all_delimiters,
     extract_markdown_images,
     extract_markdown_links,
     split_nodes_image,
@@ -9,172 +10,253 @@ from inline_markdown import (
 )
 from textnode import TextNode, TextType
 
+TEXT, BOLD, ITALIC, CODE = TextType.TEXT, TextType.BOLD, TextType.ITALIC, TextType.CODE
+LINK, IMAGE = TextType.LINK, TextType.IMAGE
+
+
+def _flat(nodes):
+    """
+    Flattens TextNodes to (text, text_type) tuples for a single list comparison.
+
+    The URL is appended only when a node has one, so URL-less nodes compare as plain pairs.
+    """
+    return [
+        (node.text, node.text_type) if node.url is None else (node.text, node.text_type, node.url)
+        for node in nodes
+    ]
+
+
+# (text, delimiter, text_type, expected (text, text_type) pairs) for a single split_nodes_delimiter pass
+DELIM_CASES = [
+    (
+        "This is text with a **bolded** word", "**", BOLD,
+        [
+            ("This is text with a ", TEXT),
+            ("bolded", BOLD),
+            (" word", TEXT),
+        ],
+    ),
+    (
+        "This is text with a **bolded** word and **another**", "**", BOLD,
+        [
+            ("This is text with a ", TEXT),
+            ("bolded", BOLD),
+            (" word and ", TEXT),
+            ("another", BOLD),
+        ],
+    ),
+    (
+        "This is text with a **bolded word** and **another**", "**", BOLD,
+        [
+            ("This is text with a ", TEXT),
+            ("bolded word", BOLD),
+            (" and ", TEXT),
+            ("another", BOLD),
+        ],
+    ),
+    (
+        "This is text with an _italic_ word", "_", ITALIC,
+        [
+            ("This is text with an ", TEXT),
+            ("italic", ITALIC),
+            (" word", TEXT),
+        ],
+    ),
+    (
+        "This is text with a `code block` word", "`", CODE,
+        [
+            ("This is text with a ", TEXT),
+            ("code block", CODE),
+            (" word", TEXT),
+        ],
+    ),
+]
+
+# (text, expected (text, text_type) pairs) for a bold pass followed by an italic pass
+BOLD_THEN_ITALIC_CASES = [
+    (
+        "**bold** and _italic_",
+        [
+            ("bold", BOLD),
+            (" and ", TEXT),
+            ("italic", ITALIC),
+        ],
+    ),
+    (
+        # Adjacent formatted sections without spaces
+        "**bold**_italic_",
+        [
+            ("bold", BOLD),
+            ("italic", ITALIC),
+        ],
+    ),
+    (
+        # Nested formatting should not be split
+        "This is **bold and _italic_** text",
+        [
+            ("This is ", TEXT),
+            ("bold and _italic_", BOLD),
+            (" text", TEXT),
+        ],
+    ),
+]
+
+# (text, delimiter, text_type) inputs whose delimiters are not properly closed
+UNMATCHED_DELIM_CASES = [
+    ("This is an *italic sentence", "*", ITALIC),
+    ("This is **bold and more", "**", BOLD),
+]
+
+# (text, expected (alt, url) pairs) for extract_markdown_images: single, multiple, none
+EXTRACT_IMAGE_CASES = [
+    (
+        "This is text with an ![image](https://i.imgur.com/zjjcJKZ.png)",
+        [("image", "https://i.imgur.com/zjjcJKZ.png")],
+    ),
+    (
+        "![img1](url1.png) and ![img2](url2.jpg) and text ![img3](url3.gif)",
+        [("img1", "url1.png"), ("img2", "url2.jpg"), ("img3", "url3.gif")],
+    ),
+    ("This text has no images, maybe a [link](here.com)?", []),
+]
+
+# (text, expected (anchor, url) pairs) for extract_markdown_links: single, multiple, none
+EXTRACT_LINK_CASES = [
+    (
+        "This is text with a [link](https://www.google.com).",
+        [("link", "https://www.google.com")],
+    ),
+    ("Text with [link1](url1) and [link2](url2).", [("link1", "url1"), ("link2", "url2")]),
+    ("This text has no links.", []),
+]
+
+# Expected nodes for the split_nodes_image, split_nodes_link and text_to_textnodes tests
+EXPECTED_SINGLE_IMAGE = (
+    TextNode("This is text with an ", TEXT),
+    TextNode("image", IMAGE, "https://i.imgur.com/zjjcJKZ.png"),
+)
 
-class TestInlineMarkdown(unittest.TestCase):
-    """Tests for inline markdown processing functions."""
+EXPECTED_MULTIPLE_IMAGES = (
+    TextNode("This is text with an ", TEXT),
+    TextNode("image", IMAGE, "https://i.imgur.com/zjjcJKZ.png"),
+    TextNode(" and another ", TEXT),
+    TextNode("second image", IMAGE, "https://i.imgur.com/3elNhQu.png"),
+)
 
-    # --- Tests for split_nodes_delimiter function ---
+EXPECTED_SINGLE_LINK = (
+    TextNode("This is text with a ", TEXT),
+    TextNode("link", LINK, "https://example.com"),
+)
 
-    def test_delim_bold(self):
-        """Test for bold formatting using ** delimiter."""
-        node = TextNode("This is text with a **bolded** word", TextType.TEXT)
-        new_nodes = split_nodes_delimiter([node], "**", TextType.BOLD)
-        self.assertListEqual(
-            [
-                TextNode("This is text with a ", TextType.TEXT),
-                TextNode("bolded", TextType.BOLD),
-                TextNode(" word", TextType.TEXT),
-            ],
-            new_nodes,
-        )
+EXPECTED_MULTIPLE_LINKS = (
+    TextNode("This is text with a ", TEXT),
+    TextNode("link", LINK, "https://boot.dev"),
+    TextNode(" and ", TEXT),
+    TextNode("another link", LINK, "https://blog.boot.dev"),
+    TextNode(" with text that follows", TEXT),
+)
 
-    def test_delim_bold_double(self):
-        """Test multiple bolded words in a sentence using ** delimiter."""
-        node = TextNode(
-            "This is text with a **bolded** word and **another**", TextType.TEXT)
-        new_nodes = split_nodes_delimiter([node], "**", TextType.BOLD)
-        self.assertListEqual(
-            [
-                TextNode("This is text with a ", TextType.TEXT),
-                TextNode("bolded", TextType.BOLD),
-                TextNode(" word and ", TextType.TEXT),
-                TextNode("another", TextType.BOLD),
-            ],
-            new_nodes,
-        )
+EXPECTED_NESTED_TEXTNODES = (
+    TextNode("This is ", TEXT),
+    TextNode("bold with a [link](https://example.com) inside", BOLD),
+)
 
-    def test_delim_bold_multiword(self):
-        """Test bold formatting for multiple words using ** delimiter."""
-        node = TextNode(
-            "This is text with a **bolded word** and **another**", TextType.TEXT)
-        new_nodes = split_nodes_delimiter([node], "**", TextType.BOLD)
-        self.assertListEqual(
-            [
-                TextNode("This is text with a ", TextType.TEXT),
-                TextNode("bolded word", TextType.BOLD),
-                TextNode(" and ", TextType.TEXT),
-                TextNode("another", TextType.BOLD),
-            ],
-            new_nodes,
-        )
+EXPECTED_ALL_TEXTNODES = (
+    TextNode("This is ", TEXT),
+    TextNode("text", BOLD),
+    TextNode(" with an ", TEXT),
+    TextNode("italic", ITALIC),
+    TextNode(" word and a ", TEXT),
+    TextNode("code block", CODE),
+    TextNode(" and an ", TEXT),
+    TextNode("image", IMAGE, "https://i.imgur.com/zjjcJKZ.png"),
+    TextNode(" and a ", TEXT),
+    TextNode("link", LINK, "https://boot.dev"),
+)
 
-    def test_delim_italic(self):
-        """Test italic formatting using _ delimiter."""
-        node = TextNode("This is text with an _italic_ word", TextType.TEXT)
-        new_nodes = split_nodes_delimiter([node], "_", TextType.ITALIC)
-        self.assertListEqual(
-            [
-                TextNode("This is text with an ", TextType.TEXT),
-                TextNode("italic", TextType.ITALIC),
-                TextNode(" word", TextType.TEXT),
-            ],
-            new_nodes,
-        )
 
-    def test_delim_bold_and_italic(self):
-        """Test bold and italic formatting together using ** and _ delimiters."""
-        node = TextNode("**bold** and _italic_", TextType.TEXT)
-        new_nodes = split_nodes_delimiter([node], "**", TextType.BOLD)
-        new_nodes = split_nodes_delimiter(new_nodes, "_", TextType.ITALIC)
-        self.assertListEqual(
-            [
-                TextNode("bold", TextType.BOLD),
-                TextNode(" and ", TextType.TEXT),
-                TextNode("italic", TextType.ITALIC),
-            ],
-            new_nodes,
-        )
+class TestInlineMarkdown(unittest.TestCase):
+    """Tests for inline markdown processing functions."""
 
-    def test_delim_code(self):
-        """Test inline code formatting using ` delimiter."""
-        node = TextNode("This is text with a `code block` word", TextType.TEXT)
-        new_nodes = split_nodes_delimiter([node], "`", TextType.CODE)
-        self.assertListEqual(
-            [
-                TextNode("This is text with a ", TextType.TEXT),
-                TextNode("code block", TextType.CODE),
-                TextNode(" word", TextType.TEXT),
-            ],
-            new_nodes,
-        )
+    # --- Tests for split_nodes_delimiter function ---
 
-    def test_delim_unmatched(self):
+    def test_delim_cases(self):
+        """Test single-delimiter splitting for bold, italic and code formatting."""
+        for text, delimiter, text_type, expected in DELIM_CASES:
+            with self.subTest(text=text):
+                node = TextNode(text, TEXT)
+                new_nodes = split_nodes_delimiter([node], delimiter, text_type)
+                self.assertEqual(expected, _flat(new_nodes))
+
+    def test_delim_bold_then_italic_cases(self):
+        """Test a bold pass followed by an italic pass over the same nodes."""
+        for text, expected in BOLD_THEN_ITALIC_CASES:
+            with self.subTest(text=text):
+                node = TextNode(text, TEXT)
+                new_nodes = split_nodes_delimiter([node], "**", BOLD)
+                new_nodes = split_nodes_delimiter(new_nodes, "_", ITALIC)
+                self.assertEqual(expected, _flat(new_nodes))
+
+    def test_delim_unmatched_cases(self):
         """Test behavior when delimiters are not properly closed."""
-        node = TextNode("This is an *italic sentence", TextType.TEXT)
-        with self.assertRaises(ValueError):
-            split_nodes_delimiter([node], "*", TextType.ITALIC)
-
-    def test_delim_adjacent(self):
-        """Test adjacent formatted sections without spaces."""
-        node = TextNode("**bold**_italic_", TextType.TEXT)
-        new_nodes = split_nodes_delimiter([node], "**", TextType.BOLD)
-        new_nodes = split_nodes_delimiter(new_nodes, "_", TextType.ITALIC)
-        self.assertListEqual(
+        for text, delimiter, text_type in UNMATCHED_DELIM_CASES:
+            with self.subTest(text=text):
+                node = TextNode(text, TEXT)
+                with self.assertRaises(ValueError):
+                    split_nodes_delimiter([node], delimiter, text_type)
+
+    # --- Tests for split_nodes_all_delimiters function ---
+
+    def test_all_delims(self):
+        """Test bold, italic and code sections split out in a single pass."""
+        node = TextNode(
+            "This is **bold**, _italic_ and `code` text", TEXT)
+        new_nodes = split_nodes_all_delimiters([node])
+        self.assertEqual(
             [
-                TextNode("bold", TextType.BOLD),
-                TextNode("italic", TextType.ITALIC),
+                ("This is ", TEXT),
+                ("bold", BOLD),
+                (", ", TEXT),
+                ("italic", ITALIC),
+                (" and ", TEXT),
+                ("code", CODE),
+                (" text", TEXT),
             ],
-            new_nodes,
+            _flat(new_nodes),
         )
 
-    def test_delim_nested(self):
-        """Test behavior with nested formatting, which should not be parsed incorrectly."""
-        node = TextNode("This is **bold and _italic_** text", TextType.TEXT)
-        new_nodes = split_nodes_delimiter([node], "**", TextType.BOLD)
-        new_nodes = split_nodes_delimiter(new_nodes, "_", TextType.ITALIC)
-        self.assertListEqual(
+    def test_all_delims_literal_inside_section(self):
+        """Test that delimiters inside a delimited section are kept as literal text."""
+        node = TextNode("Run `my_var = **kwargs` now", TEXT)
+        new_nodes = split_nodes_all_delimiters([node])
+        self.assertEqual(
             [
-                TextNode("This is ", TextType.TEXT),
-                # Nested case should not be split
-                TextNode("bold and _italic_", TextType.BOLD),
-                TextNode(" text", TextType.TEXT),
+                ("Run ", TEXT),
+                ("my_var = **kwargs", CODE),
+                (" now", TEXT),
             ],
-            new_nodes,
+            _flat(new_nodes),
         )
 
-    # --- Tests for extract_markdown_images function ---
-
-    def test_extract_images_single(self):
-        """Test extracting a single markdown image."""
-        text = "This is text with an ![image](https://i.imgur.com/zjjcJKZ.png)"
-        matches = extract_markdown_images(text)
-        self.assertListEqual(
-            [("image", "https://i.imgur.com/zjjcJKZ.png")], matches)
-
-    def test_extract_images_multiple(self):
-        """Test extracting multiple markdown images."""
-        text = "![img1](url1.png) and ![img2](url2.jpg) and text ![img3](url3.gif)"
-        matches = extract_markdown_images(text)
-        self.assertListEqual(
-            [("img1", "url1.png"), ("img2", "url2.jpg"),
-             ("img3", "url3.gif")], matches
-        )
-
-    def test_extract_images_none(self):
-        """Test text with no markdown images."""
-        text = "This text has no images, maybe a [link](here.com)?"
-        matches = extract_markdown_images(text)
-        self.assertListEqual([], matches)
-
-    # --- Tests for extract_markdown_links function ---
+    def test_all_delims_unmatched(self):
+        """Test behavior when a delimiter is not properly closed."""
+        node = TextNode("This is **bold and `code`", TEXT)
+        with self.assertRaises(ValueError):
+            split_nodes_all_delimiters([node])
 
-    def test_extract_links_single(self):
-        """Test extracting a single markdown link."""
-        text = "This is text with a [link](https://www.google.com)."
-        matches = extract_markdown_links(text)
-        self.assertListEqual([("link", "https://www.google.com")], matches)
+    # --- Tests for extract_markdown_images / extract_markdown_links functions ---
 
-    def test_extract_links_multiple(self):
-        """Test extracting multiple markdown links."""
-        text = "Text with [link1](url1) and [link2](url2)."
-        matches = extract_markdown_links(text)
-        self.assertListEqual([("link1", "url1"), ("link2", "url2")], matches)
+    def test_extract_images_cases(self):
+        """Test extracting markdown images from text."""
+        for text, expected in EXTRACT_IMAGE_CASES:
+            with self.subTest(text=text):
+                self.assertListEqual(expected, extract_markdown_images(text))
 
-    def test_extract_links_none(self):
-        """Test text with no markdown links."""
-        text = "This text has no links."
-        matches = extract_markdown_links(text)
-        self.assertListEqual([], matches)
+    def test_extract_links_cases(self):
+        """Test extracting markdown links from text."""
+        for text, expected in EXTRACT_LINK_CASES:
+            with self.subTest(text=text):
+                self.assertListEqual(expected, extract_markdown_links(text))
 
     # --- Tests for split_nodes_image function ---
 
@@ -182,7 +264,7 @@ class TestInlineMarkdown(unittest.TestCase):
         """Test splitting nodes containing no images."""
         node = TextNode(
             "This is text with no images.",
-            TextType.TEXT,
+            TEXT,
         )
         new_nodes = split_nodes_image([node])
         self.assertListEqual([node], new_nodes)
@@ -191,37 +273,19 @@ class TestInlineMarkdown(unittest.TestCase):
         """Test splitting nodes containing a single image."""
         node = TextNode(
             "This is text with an ![image](https://i.imgur.com/zjjcJKZ.png)",
-            TextType.TEXT,
+            TEXT,
         )
         new_nodes = split_nodes_image([node])
-        self.assertListEqual(
-            [
-                TextNode("This is text with an ", TextType.TEXT),
-                TextNode("image", TextType.IMAGE,
-                         "https://i.imgur.com/zjjcJKZ.png"),
-            ],
-            new_nodes,
-        )
+        self.assertListEqual(list(EXPECTED_SINGLE_IMAGE), new_nodes)
 
     def test_split_multiple_images(self):
         """Test splitting nodes containing multiple images."""
         node = TextNode(
             "This is text with an ![image](https://i.imgur.com/zjjcJKZ.png) and another ![second image](https://i.imgur.com/3elNhQu.png)",
-            TextType.TEXT,
+            TEXT,
         )
         new_nodes = split_nodes_image([node])
-        self.assertListEqual(
-            [
-                TextNode("This is text with an ", TextType.TEXT),
-                TextNode("image", TextType.IMAGE,
-                         "https://i.imgur.com/zjjcJKZ.png"),
-                TextNode(" and another ", TextType.TEXT),
-                TextNode(
-                    "second image", TextType.IMAGE, "https://i.imgur.com/3elNhQu.png"
-                ),
-            ],
-            new_nodes,
-        )
+        self.assertListEqual(list(EXPECTED_MULTIPLE_IMAGES), new_nodes)
 
     # --- Tests for split_nodes_link function ---
 
@@ -229,7 +293,7 @@ class TestInlineMarkdown(unittest.TestCase):
         """Test splitting nodes containing no links."""
         node = TextNode(
             "This is text with no links.",
-            TextType.TEXT,
+            TEXT,
         )
         new_nodes = split_nodes_link([node])
         self.assertListEqual([node], new_nodes)
@@ -238,35 +302,19 @@ class TestInlineMarkdown(unittest.TestCase):
         """Test splitting nodes containing a single link."""
         node = TextNode(
             "This is text with a [link](https://example.com)",
-            TextType.TEXT,
+            TEXT,
         )
         new_nodes = split_nodes_link([node])
-        self.assertListEqual(
-            [
-                TextNode("This is text with a ", TextType.TEXT),
-                TextNode("link", TextType.LINK, "https://example.com"),
-            ],
-            new_nodes,
-        )
+        self.assertListEqual(list(EXPECTED_SINGLE_LINK), new_nodes)
 
     def test_split_multiple_links(self):
         """Test splitting nodes containing multiple links."""
         node = TextNode(
             "This is text with a [link](https://boot.dev) and [another link](https://blog.boot.dev) with text that follows",
-            TextType.TEXT,
+            TEXT,
         )
         new_nodes = split_nodes_link([node])
-        self.assertListEqual(
-            [
-                TextNode("This is text with a ", TextType.TEXT),
-                TextNode("link", TextType.LINK, "https://boot.dev"),
-                TextNode(" and ", TextType.TEXT),
-                TextNode("another link", TextType.LINK,
-                         "https://blog.boot.dev"),
-                TextNode(" with text that follows", TextType.TEXT),
-            ],
-            new_nodes,
-        )
+        self.assertListEqual(list(EXPECTED_MULTIPLE_LINKS), new_nodes)
 
     # --- Tests for text_to_textnodes function ---
 
@@ -274,36 +322,14 @@ class TestInlineMarkdown(unittest.TestCase):
         """Test with nested elements."""
         nodes = text_to_textnodes(
             "This is **bold with a [link](https://example.com) inside**")
-        self.assertListEqual(
-            [
-                TextNode("This is ", TextType.TEXT),
-                TextNode(
-                    "bold with a [link](https://example.com) inside", TextType.BOLD),
-            ],
-            nodes,
-        )
+        self.assertListEqual(list(EXPECTED_NESTED_TEXTNODES), nodes)
 
     def test_text_to_textnodes(self):
         """Test with a variety of elements."""
         nodes = text_to_textnodes(
             "This is **text** with an _italic_ word and a `code block` and an ![image](https://i.imgur.com/zjjcJKZ.png) and a [link](https://boot.dev)"
         )
-        self.assertListEqual(
-            [
-                TextNode("This is ", TextType.TEXT),
-                TextNode("text", TextType.BOLD),
-                TextNode(" with an ", TextType.TEXT),
-                TextNode("italic", TextType.ITALIC),
-                TextNode(" word and a ", TextType.TEXT),
-                TextNode("code block", TextType.CODE),
-                TextNode(" and an ", TextType.TEXT),
-                TextNode("image", TextType.IMAGE,
-                         "https://i.imgur.com/zjjcJKZ.png"),
-                TextNode(" and a ", TextType.TEXT),
-                TextNode("link", TextType.LINK, "https://boot.dev"),
-            ],
-            nodes,
-        )
+        self.assertListEqual(list(EXPECTED_ALL_TEXTNODES), nodes)
 
 
 if __name__ == "__main__":
@@ -1,220 +1,218 @@
+import textwrap
 import unittest
 from markdown_blocks import (
     markdown_to_html_node,
     markdown_to_blocks,
     block_to_block_type,
+    olist_to_html_node,
     BlockType,
 )
 
 
-class TestMarkdownToBlocks(unittest.TestCase):
-    def test_basic_blocks(self):
-        """Blocks should be split by double newlines, and each trimmed."""
-        md = """
-This is **bolded** paragraph
-
-This is another paragraph with _italic_ text and `code` here
-This is the same paragraph on a new line
-
-- This is a list
-- with items
-"""
-        blocks = markdown_to_blocks(md)
-        self.assertEqual(
-            blocks,
-            [
-                "This is **bolded** paragraph",
-                "This is another paragraph with _italic_ text and `code` here\nThis is the same paragraph on a new line",
-                "- This is a list\n- with items",
-            ],
-        )
+# Blocks expected from both the basic and the excessive-blank-lines markdown below
+BASIC_BLOCKS = [
+    "This is **bolded** paragraph",
+    "This is another paragraph with _italic_ text and `code` here\nThis is the same paragraph on a new line",
+    "- This is a list\n- with items",
+]
 
-    def test_excessive_blank_lines(self):
-        """Multiple consecutive blank lines should not create empty blocks."""
-        md = """
-This is **bolded** paragraph
+# (name, markdown, expected blocks) for markdown_to_blocks
+MARKDOWN_TO_BLOCKS_CASES = [
+    # Blocks are split by blank lines, and each is trimmed
+    (
+        "basic_blocks",
+        textwrap.dedent("""
+            This is **bolded** paragraph
 
+            This is another paragraph with _italic_ text and `code` here
+            This is the same paragraph on a new line
 
+            - This is a list
+            - with items
+        """).strip(),
+        BASIC_BLOCKS,
+    ),
+    # Multiple consecutive blank lines do not create empty blocks
+    (
+        "excessive_blank_lines",
+        textwrap.dedent("""
+            This is **bolded** paragraph
 
 
-This is another paragraph with _italic_ text and `code` here
-This is the same paragraph on a new line
 
-- This is a list
-- with items
-"""
-        blocks = markdown_to_blocks(md)
-        self.assertEqual(
-            blocks,
-            [
-                "This is **bolded** paragraph",
-                "This is another paragraph with _italic_ text and `code` here\nThis is the same paragraph on a new line",
-                "- This is a list\n- with items",
-            ],
-        )
 
-    def test_leading_and_trailing_whitespace(self):
-        """Whitespace around blocks should be trimmed."""
-        md = """
+            This is another paragraph with _italic_ text and `code` here
+            This is the same paragraph on a new line
+
+            - This is a list
+            - with items
+        """).strip(),
+        BASIC_BLOCKS,
+    ),
+    # Whitespace around blocks is trimmed
+    (
+        "leading_and_trailing_whitespace",
+        """
 
 
    # Heading
 
    Paragraph with text
 
-"""
-        blocks = markdown_to_blocks(md)
-        self.assertEqual(
-            blocks,
-            [
-                "# Heading",
-                "Paragraph with text"
-            ]
-        )
-
-    def test_empty_string(self):
-        """An empty string should return an empty list."""
-        self.assertEqual(markdown_to_blocks(""), [])
-
-    def test_only_blank_lines(self):
-        """A string with only newlines or whitespace should return an empty list."""
-        md = "\n\n   \n\n\t\n"
-        self.assertEqual(markdown_to_blocks(md), [])
-
-    def test_single_block(self):
-        """A single block of text should be returned as a one-element list."""
-        md = "Just a single paragraph"
-        self.assertEqual(markdown_to_blocks(md), ["Just a single paragraph"])
-
-
-class TestMarkdownBlockTypes(unittest.TestCase):
-    """
-    Test suite for the markdown block type detection functionality.
-    """
-
-    def test_block_to_block_types(self):
-        block = "# heading"
-        self.assertEqual(block_to_block_type(block), BlockType.HEADING)
-
-        block = "```\ncode\n```"
-        self.assertEqual(block_to_block_type(block), BlockType.CODE)
+""",
+        ["# Heading", "Paragraph with text"],
+    ),
+    # Blank lines containing only spaces or tabs still separate blocks
+    ("whitespace_only_separator_lines", "First paragraph\n   \n\t\nSecond paragraph", ["First paragraph", "Second paragraph"]),
+    ("empty_string", "", []),
+    ("only_blank_lines", "\n\n   \n\n\t\n", []),
+    ("single_block", "Just a single paragraph", ["Just a single paragraph"]),
+]
+
+# (block, expected BlockType) for block_to_block_type
+BLOCK_TYPE_CASES = [
+    ("# heading", BlockType.HEADING),
+    ("```\ncode\n```", BlockType.CODE),
+    ("> quote\n> more quote", BlockType.QUOTE),
+    ("- list\n- items", BlockType.ULIST),
+    ("1. list\n2. items", BlockType.OLIST),
+    ("This is a paragraph with no special formatting.", BlockType.PARAGRAPH),
+]
+
+# Blocks that resemble another block type but must be classified as paragraphs
+NEAR_MISS_PARAGRAPHS = ["#no space", "####### seven", "```\nunclosed", "-no space", "1.no space", "1. one\n3. three", ""]
+
+
+# Markdown documents and the HTML expected from markdown_to_html_node, dedented and stripped once at import
+MD_PARAGRAPH = textwrap.dedent("""
+    This is **bolded** paragraph
+    text in a p
+    tag here
+""").strip()
+EXPECTED_PARAGRAPH_HTML = (
+    "<div><p>This is <b>bolded</b> paragraph text in a p tag here</p></div>"
+)
 
-        block = "> quote\n> more quote"
-        self.assertEqual(block_to_block_type(block), BlockType.QUOTE)
+MD_PARAGRAPHS = textwrap.dedent("""
+    This is **bolded** paragraph
+    text in a p
+    tag here
 
-        block = "- list\n- items"
-        self.assertEqual(block_to_block_type(block), BlockType.ULIST)
+    This is another paragraph with _italic_ text and `code` here
+""").strip()
+EXPECTED_PARAGRAPHS_HTML = (
+    "<div><p>This is <b>bolded</b> paragraph text in a p tag here</p><p>This is another paragraph with <i>italic</i> text and <code>code</code> here</p></div>"
+)
 
-        block = "1. list\n2. items"
-        self.assertEqual(block_to_block_type(block), BlockType.OLIST)
+MD_LISTS = textwrap.dedent("""
+    - This is a list
+    - with items
+    - and _more_ items
+
+    1. This is an `ordered` list
+    2. with items
+    3. and more items
+""").strip()
+EXPECTED_LISTS_HTML = (
+    "<div><ul><li>This is a list</li><li>with items</li><li>and <i>more</i> items</li></ul><ol><li>This is an <code>ordered</code> list</li><li>with items</li><li>and more items</li></ol></div>"
+)
 
-        block = "This is a paragraph with no special formatting."
-        self.assertEqual(block_to_block_type(block), BlockType.PARAGRAPH)
+MD_HEADINGS = textwrap.dedent("""
+    # this is an h1
 
+    this is paragraph text
 
-class TestMarkdownToHtmlNode(unittest.TestCase):
-    """
-    Test suite for the markdown_to_html_node function, which converts a full 
-    markdown document into a single parent HTMLNode.
-    """
-
-    def test_paragraph(self):
-        md = """
-This is **bolded** paragraph
-text in a p
-tag here
+    ## this is an h2
+""").strip()
+EXPECTED_HEADINGS_HTML = (
+    "<div><h1>this is an h1</h1><p>this is paragraph text</p><h2>this is an h2</h2></div>"
+)
 
-"""
+MD_BLOCKQUOTE = textwrap.dedent("""
+    > This is a
+    > blockquote block
 
-        node = markdown_to_html_node(md)
-        html = node.to_html()
-        self.assertEqual(
-            html,
-            "<div><p>This is <b>bolded</b> paragraph text in a p tag here</p></div>",
-        )
+    this is paragraph text
+""").strip()
+EXPECTED_BLOCKQUOTE_HTML = (
+    "<div><blockquote>This is a blockquote block</blockquote><p>this is paragraph text</p></div>"
+)
 
-    def test_paragraphs(self):
-        md = """
-This is **bolded** paragraph
-text in a p
-tag here
+MD_CODE = textwrap.dedent("""
+    ```
+    This is text that _should_ remain
+    the **same** even with inline stuff
+    ```
+""").strip()
+EXPECTED_CODE_HTML = (
+    "<div><pre><code>This is text that _should_ remain\nthe **same** even with inline stuff\n</code></pre></div>"
+)
 
-This is another paragraph with _italic_ text and `code` here
+# Eleven items, so the list numbering reaches two digits
+MD_LONG_ORDERED_LIST = "\n".join(f"{number}. item {number}" for number in range(1, 12))
+EXPECTED_LONG_ORDERED_LIST_HTML = (
+    "<div><ol>" + "".join(f"<li>item {number}</li>" for number in range(1, 12)) + "</ol></div>"
+)
 
-"""
+# (name, markdown, expected HTML) rows; each becomes a test_<name> method on TestMarkdownToHtmlNode
+HTML_CASES = [
+    ("paragraph", MD_PARAGRAPH, EXPECTED_PARAGRAPH_HTML),
+    ("paragraphs", MD_PARAGRAPHS, EXPECTED_PARAGRAPHS_HTML),
+    ("lists", MD_LISTS, EXPECTED_LISTS_HTML),
+    ("long_ordered_list", MD_LONG_ORDERED_LIST, EXPECTED_LONG_ORDERED_LIST_HTML),
+    ("headings", MD_HEADINGS, EXPECTED_HEADINGS_HTML),
+    ("blockquote", MD_BLOCKQUOTE, EXPECTED_BLOCKQUOTE_HTML),
+    ("code", MD_CODE, EXPECTED_CODE_HTML),
+]
 
-        node = markdown_to_html_node(md)
-        html = node.to_html()
-        self.assertEqual(
-            html,
-            "<div><p>This is <b>bolded</b> paragraph text in a p tag here</p><p>This is another paragraph with <i>italic</i> text and <code>code</code> here</p></div>",
-        )
 
-    def test_lists(self):
-        md = """
-- This is a list
-- with items
-- and _more_ items
+class TestMarkdownToBlocks(unittest.TestCase):
+    def test_markdown_to_blocks_cases(self):
+        """Test splitting markdown into trimmed, non-empty blocks."""
+        for name, md, expected in MARKDOWN_TO_BLOCKS_CASES:
+            with self.subTest(name):
+                self.assertEqual(markdown_to_blocks(md), expected)
 
-1. This is an `ordered` list
-2. with items
-3. and more items
 
-"""
+class TestMarkdownBlockTypes(unittest.TestCase):
+    """
+    Test suite for the markdown block type detection functionality.
+    """
 
-        node = markdown_to_html_node(md)
-        html = node.to_html()
-        self.assertEqual(
-            html,
-            "<div><ul><li>This is a list</li><li>with items</li><li>and <i>more</i> items</li></ul><ol><li>This is an <code>ordered</code> list</li><li>with items</li><li>and more items</li></ol></div>",
+    def test_block_to_block_types(self):
+        # Classify every block and compare once; the list diff still points at any mismatch
+        self.assertListEqual(
+            [block_to_block_type(block) for block, _ in BLOCK_TYPE_CASES],
+            [expected for _, expected in BLOCK_TYPE_CASES],
         )
 
-    def test_headings(self):
-        md = """
-# this is an h1
-
-this is paragraph text
+    def test_near_miss_prefixes_are_paragraphs(self):
+        for block in NEAR_MISS_PARAGRAPHS:
+            with self.subTest(block=block):
+                self.assertEqual(block_to_block_type(block), BlockType.PARAGRAPH)
 
-## this is an h2
-"""
 
-        node = markdown_to_html_node(md)
-        html = node.to_html()
-        self.assertEqual(
-            html,
-            "<div><h1>this is an h1</h1><p>this is paragraph text</p><h2>this is an h2</h2></div>",
-        )
+class TestMarkdownToHtmlNode(unittest.TestCase):
+    """
+    Test suite for the markdown_to_html_node function, which converts a full 
+    markdown document into a single parent HTMLNode.
+    """
 
-    def test_blockquote(self):
-        md = """
-> This is a
-> blockquote block
+    def test_olist_item_without_marker_raises(self):
+        with self.assertRaises(ValueError) as context:
+            olist_to_html_node("1. first\nsecond")
+        self.assertEqual(str(context.exception), "invalid ordered list block")
 
-this is paragraph text
 
-"""
+def _make_html_test(md, expected):
+    """Builds a test method asserting that md renders to the expected HTML."""
+    def test(self):
+        self.assertEqual(markdown_to_html_node(md).to_html(), expected)
+    return test
 
-        node = markdown_to_html_node(md)
-        html = node.to_html()
-        self.assertEqual(
-            html,
-            "<div><blockquote>This is a blockquote block</blockquote><p>this is paragraph text</p></div>",
-        )
 
-    def test_code(self):
-        md = """
-```
-This is text that _should_ remain
-the **same** even with inline stuff
-```
-"""
-
-        node = markdown_to_html_node(md)
-        html = node.to_html()
-        self.assertEqual(
-            html,
-            "<div><pre><code>This is text that _should_ remain\nthe **same** even with inline stuff\n</code></pre></div>",
-        )
+for _name, _md, _expected in HTML_CASES:
+    setattr(TestMarkdownToHtmlNode, f"test_{_name}", _make_html_test(_md, _expected))
 
 
 if __name__ == "__main__":
@@ -1,23 +1,33 @@
 import unittest
+from types import SimpleNamespace
 from textnode import TextNode, TextType, text_node_to_html_node
 
 # All tests functions and file names must start with test_ to be discoverable by unittest
 
+# Reference nodes built once; tests compare freshly built nodes against them
+FIXTURES = SimpleNamespace(
+    bold=TextNode("This is a text node", TextType.BOLD),
+    link=TextNode("Link text", TextType.LINK, "https://example.com"),
+    code=TextNode("Code block", TextType.CODE, None),
+)
+
+# (text, text_type, url) constructor arguments -> expected repr()
+EXPECTED_REPRS = {
+    ("Test node", TextType.BOLD, "https://example.com"): "TextNode(Test node, bold, https://example.com)",
+    ("Plain text", TextType.TEXT, None): "TextNode(Plain text, text, None)",
+}
+
 
 class TestTextNode(unittest.TestCase):
     """Tests for the TextNode class and its methods."""
 
     def test_eq(self):
         """Test that two TextNode instances with the same text, type, and URL are equal."""
-        node = TextNode("This is a text node", TextType.BOLD)
-        node2 = TextNode("This is a text node", TextType.BOLD)
-        self.assertEqual(node, node2)
+        self.assertEqual(TextNode("This is a text node", TextType.BOLD), FIXTURES.bold)
 
     def test_eq_with_url(self):
         """Test that two TextNode instances with the same text, type, and identical URLs are equal."""
-        node = TextNode("Link text", TextType.LINK, "https://example.com")
-        node2 = TextNode("Link text", TextType.LINK, "https://example.com")
-        self.assertEqual(node, node2)
+        self.assertEqual(TextNode("Link text", TextType.LINK, "https://example.com"), FIXTURES.link)
 
     def test_not_eq_different_text(self):
         """Test that two TextNode instances with different text but the same type are not equal."""
@@ -33,28 +43,42 @@ class TestTextNode(unittest.TestCase):
 
     def test_not_eq_different_url(self):
         """Test that two TextNode instances with the same text and type but different URLs are not equal."""
-        node = TextNode("Link text", TextType.LINK, "https://example.com")
-        node2 = TextNode("Link text", TextType.LINK,
-                         "https://another-example.com")
-        self.assertNotEqual(node, node2)
+        self.assertNotEqual(TextNode("Link text", TextType.LINK, "https://another-example.com"), FIXTURES.link)
 
     def test_eq_both_urls_none(self):
         """Test that two TextNode instances with identical text, type, and both URLs as None are equal."""
-        node = TextNode("Code block", TextType.CODE, None)
-        node2 = TextNode("Code block", TextType.CODE, None)
-        self.assertEqual(node, node2)
+        self.assertEqual(TextNode("Code block", TextType.CODE, None), FIXTURES.code)
 
     def test_not_eq_one_url_none(self):
         """Test that a TextNode with a URL is not equal to another with None as the URL."""
+        self.assertNotEqual(TextNode("Link text", TextType.LINK, None), FIXTURES.link)
+
+    def test_not_eq_other_type(self):
+        """Test that a TextNode is not equal to an object of another type."""
+        self.assertNotEqual(FIXTURES.bold, ("This is a text node", TextType.BOLD, None))
+
+    def test_not_eq_plain_int_text_type(self):
+        """Test that a plain int text type does not match the equal-valued TextType member."""
+        self.assertNotEqual(TextNode("x", int(TextType.BOLD)), TextNode("x", TextType.BOLD))
+
+    def test_eq_after_field_reassignment(self):
+        """Test that equality and hashing follow a field reassigned after construction."""
+        node = TextNode("a", TextType.TEXT)
+        node.text = "b"
+        self.assertEqual(node, TextNode("b", TextType.TEXT))
+        self.assertEqual(hash(node), hash(TextNode("b", TextType.TEXT)))
+
+    def test_hash_matches_eq(self):
+        """Test that equal TextNodes hash equally and can be used as set members."""
         node = TextNode("Link text", TextType.LINK, "https://example.com")
-        node2 = TextNode("Link text", TextType.LINK, None)
-        self.assertNotEqual(node, node2)
+        self.assertEqual(hash(node), hash(FIXTURES.link))
+        self.assertEqual(len({node, FIXTURES.link, FIXTURES.bold}), 2)
 
     def test_repr(self):
         """Test the __repr__ method of TextNode to ensure correct string representation."""
-        node = TextNode("Test node", TextType.BOLD, "https://example.com")
-        expected = "TextNode(Test node, bold, https://example.com)"
-        self.assertEqual(repr(node), expected)
+        for key, expected in EXPECTED_REPRS.items():
+            with self.subTest(key=key):
+                self.assertEqual(repr(TextNode(*key)), expected)
 
 
 class TestTextNodeToHTMLNode(unittest.TestCase):
@@ -106,12 +130,31 @@ class TestTextNodeToHTMLNode(unittest.TestCase):
         self.assertEqual(html_node.props, {
                          "src": "https://example.com/image.png", "alt": "An image"})
 
+    def test_escapes_html_special_characters(self):
+        """Test that text is escaped as element content and URLs/alt text as attribute values."""
+        node = text_node_to_html_node(TextNode('< Back & "home"', TextType.BOLD))
+        self.assertEqual(node.to_html(), '<b>&lt; Back &amp; "home"</b>')
+        link = text_node_to_html_node(TextNode("<Tag>", TextType.LINK, '/search?q=a&b="c"'))
+        self.assertEqual(link.to_html(), '<a href="/search?q=a&amp;b=&quot;c&quot;">&lt;Tag&gt;</a>')
+        image = text_node_to_html_node(TextNode('Say "hi"', TextType.IMAGE, "/hi.png"))
+        self.assertEqual(image.props, {"src": "/hi.png", "alt": "Say &quot;hi&quot;"})
+
     def test_invalid_type(self):
         """Test conversion of an invalid text node type raises ValueError."""
         node = TextNode("Invalid", None)
         with self.assertRaises(ValueError):
             text_node_to_html_node(node)
 
+    def test_missing_url_raises(self):
+        """Test that link and image nodes without a URL raise ValueError."""
+        for text_type in (TextType.LINK, TextType.IMAGE):
+            with self.subTest(text_type=text_type):
+                with self.assertRaises(ValueError) as context:
+                    text_node_to_html_node(TextNode("No url", text_type))
+                self.assertEqual(
+                    str(context.exception), f"invalid text node: {text_type.name.lower()} has no url"
+                )
+
 
 if __name__ == "__main__":
     unittest.main()
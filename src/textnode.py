@@ -1,15 +1,27 @@
 from htmlnode import LeafNode
-from enum import Enum
+from enum import IntEnum
+from html import escape
 
 
-class TextType(Enum):
-    """Enumeration of the different types of inline text supported"""
-    TEXT = "text"
-    BOLD = "bold"
-    ITALIC = "italic"
-    CODE = "code"
-    LINK = "link"
-    IMAGE = "image"
+class TextType(IntEnum):
+    """
+    Enumeration of the different types of inline text supported.
+
+    Members are small ints, so comparing and hashing them stays in C. Each
+    member's html_tag is the tag of the LeafNode it converts to (None for plain text).
+    """
+    TEXT = (0, None)
+    BOLD = (1, "b")
+    ITALIC = (2, "i")
+    CODE = (3, "code")
+    LINK = (4, "a")
+    IMAGE = (5, "img")
+
+    def __new__(cls, value, html_tag):
+        member = int.__new__(cls, value)
+        member._value_ = value
+        member.html_tag = html_tag
+        return member
 
 
 class TextNode():
@@ -22,6 +34,9 @@ class TextNode():
         url (str or None): The URL if the text is a link or an image; None otherwise
     """
 
+    # Parsing creates a node per inline fragment; slots drop the per-instance __dict__
+    __slots__ = ("text", "text_type", "url")
+
     def __init__(self, text, text_type, url=None):
         self.text = text
         self.text_type = text_type
@@ -29,28 +44,35 @@ class TextNode():
 
     def __eq__(self, other):
         """Checks if this TextNode is equal to another TextNode"""
-        return (
-            self.text == other.text
-            and self.text_type == other.text_type
-            and self.url == other.url
-        )
+        # Nodes the splitters pass through unchanged compare by identity first
+        if self is other:
+            return True
+        if not isinstance(other, TextNode):
+            return NotImplemented
+        # TextType members equal plain ints, so a bare int must not match a member
+        if type(self.text_type) is not type(other.text_type):
+            return False
+        return (self.text, self.text_type, self.url) == (other.text, other.text_type, other.url)
+
+    def __hash__(self):
+        """Hashes the same three fields that __eq__ compares"""
+        return hash((self.text, self.text_type, self.url))
 
     def __repr__(self):
         """Returns a string representation of the TextNode"""
-        return f"TextNode({self.text}, {self.text_type.value}, {self.url})"
+        return f"TextNode({self.text}, {self.text_type.name.lower()}, {self.url})"
 
 
 def text_node_to_html_node(text_node):
-    if text_node.text_type == TextType.TEXT:
-        return LeafNode(None, text_node.text)
-    if text_node.text_type == TextType.BOLD:
-        return LeafNode("b", text_node.text)
-    if text_node.text_type == TextType.ITALIC:
-        return LeafNode("i", text_node.text)
-    if text_node.text_type == TextType.CODE:
-        return LeafNode("code", text_node.text)
-    if text_node.text_type == TextType.LINK:
-        return LeafNode("a", text_node.text, {"href": text_node.url})
-    if text_node.text_type == TextType.IMAGE:
-        return LeafNode("img", "", {"src": text_node.url, "alt": text_node.text})
-    raise ValueError(f"invalid text type: {text_node.text_type}")
+    # Text is escaped as element content; URLs and alt text as quoted attribute values
+    text_type = text_node.text_type
+    if not isinstance(text_type, TextType):
+        raise ValueError(f"invalid text type: {text_type}")
+    # Only links and images carry props; every other type is just its tag around the text
+    if text_type in (TextType.LINK, TextType.IMAGE) and text_node.url is None:
+        raise ValueError(f"invalid text node: {text_type.name.lower()} has no url")
+    if text_type is TextType.LINK:
+        return LeafNode(text_type.html_tag, escape(text_node.text, quote=False), {"href": escape(text_node.url)})
+    if text_type is TextType.IMAGE:
+        return LeafNode(text_type.html_tag, "", {"src": escape(text_node.url), "alt": escape(text_node.text)})
+    return LeafNode(text_type.html_tag, escape(text_node.text, quote=False))